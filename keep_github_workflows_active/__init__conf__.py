@@ -2,7 +2,7 @@
 
 name = 'keep_github_workflows_active'
 title = 'keep gitgub workflows active'
-version = 'v1.1.0'
+version = 'v1.2.0'
 url = 'https://github.com/bitranox/keep_github_workflows_active'
 author = 'Robert Nowotny'
 author_email = 'bitranox@gmail.com'
@@ -16,7 +16,7 @@ Info for keep_github_workflows_active:
 
     keep gitgub workflows active
 
-    Version : v1.1.0
+    Version : v1.2.0
     Url     : https://github.com/bitranox/keep_github_workflows_active
     Author  : Robert Nowotny
     Email   : bitranox@gmail.com""")
@@ -1,11 +1,34 @@
 # STDLIB
+import atexit
+import concurrent.futures
+import functools
+import itertools
+import json
 import os
 import pathlib
+import re
 import sys
-from typing import Any, Dict, List
+import tempfile
+import threading
+import time
+import urllib.parse
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar, Union
+
+try:
+    import tomllib                                  # Python 3.11+
+except ImportError:                                 # pragma: no cover
+    import toml as tomllib                          # type: ignore  # pragma: no cover
 
 # EXT
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# optional, faster json decoding
+try:
+    import orjson
+except ImportError:                                 # pragma: no cover
+    orjson = None                                   # type: ignore  # pragma: no cover
 
 # OWN
 import lib_log_utils
@@ -14,12 +37,74 @@ import lib_detect_testenv
 # CONFIG
 
 rotek_config_directory = str(pathlib.Path("/rotek/scripts/credentials").absolute())
+# None: the default location, see _get_default_etag_cache_file()
+etag_cache_file: Optional[pathlib.Path] = None
+
+# CONSTANTS
+
+# maximum number of GitHub API requests in flight at the same time - keep it low to stay below GitHub's secondary rate limit
+MAX_CONCURRENT_REQUESTS = 10
+_request_slots = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+# seconds to wait for the connection and for the response of a request, requests has no timeout by default
+REQUEST_TIMEOUT_SECONDS = 30
+# below that number of remaining requests in the rate limit window, the requests are spread over the rest of the window
+RATE_LIMIT_THRESHOLD = 100
+# how often a request is repeated after GitHub answered with a rate limit error
+MAX_RATE_LIMIT_RETRIES = 3
+
+# headers of every GitHub API request - the Authorization header is added by the session of each token
+GITHUB_API_HEADERS = {"Accept": "application/vnd.github.v3+json"}
+
+# one token, or a tuple of tokens which are used round-robin, to multiply the rate limit budget
+GitHubTokens = Union[str, Tuple[str, ...]]
+
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+
+# the same repositories as the REST endpoint /users/{owner}/repos : owned by the owner, public, sorted by name
+_REPOSITORIES_QUERY = """
+query ($owner: String!, $after: String) {
+  repositoryOwner(login: $owner) {
+    repositories(first: 100, after: $after, ownerAffiliations: OWNER, privacy: PUBLIC, orderBy: {field: NAME, direction: ASC}) {
+      nodes { name }
+      pageInfo { endCursor hasNextPage }
+    }
+  }
+}
+"""
+
+# the same repositories, together with the file names in the '.github/workflows' directory of their default branch
+_REPOSITORIES_WORKFLOWS_QUERY = """
+query ($owner: String!, $after: String) {
+  repositoryOwner(login: $owner) {
+    repositories(first: 100, after: $after, ownerAffiliations: OWNER, privacy: PUBLIC, orderBy: {field: NAME, direction: ASC}) {
+      nodes {
+        name
+        object(expression: "HEAD:.github/workflows") { ... on Tree { entries { name } } }
+      }
+      pageInfo { endCursor hasNextPage }
+    }
+  }
+}
+"""
+
+# the dynamic workflows of GitHub Pages and Dependabot are not workflow files, and can not be enabled via the API
+_UNMANAGEABLE_WORKFLOW_PREFIXES = ("pages-build-deployment", "dependabot-updates")
+
+# one entry of the 'Link' response header, like: <https://api.github.com/...&page=2>; rel="next"
+_LINK_HEADER_ENTRY = re.compile(r'<([^>]+)>;\s*rel="([^"]+)"')
+
+# bound once, used for all environment lookups of this module
+_env_get = os.environ.get
 
+_K = TypeVar('_K')
+_T = TypeVar('_T')
+_R = TypeVar('_R')
 
-def enable_all_workflows(owner: str, github_token: str) -> None:
+
+def enable_all_workflows(owner: str, github_token: GitHubTokens) -> None:
     """
     :param owner: the repo owner
-    :param github_token:
+    :param github_token: a token, or a tuple of tokens which are used round-robin
     :return:
 
     >>> # Setup
@@ -45,15 +130,14 @@ def enable_all_workflows(owner: str, github_token: str) -> None:
 
     """
     print(f'Activating and maintaining all workflows for owner {owner}:')
-    repositories = get_repositories(owner=owner, github_token=github_token)
-    for repository in repositories:
-        workflows = get_workflows(owner=owner, repository=repository, github_token=github_token)
-        for workflow_filename in workflows:
-            print(f'activate workflow {repository}/{workflow_filename}')
-            enable_workflow(owner=owner, repository=repository, workflow_filename=workflow_filename, github_token=github_token)
+    # first read the repositories together with their workflows, then enable all of them concurrently
+    repositories_workflows = _list_repos_with_workflows_graphql(owner=owner, github_token=github_token)
+    _process_by_repository(lambda repository, workflow_filename: enable_workflow(owner=owner, repository=repository,
+                                                                                 workflow_filename=workflow_filename, github_token=github_token),
+                           repositories_workflows, 'activate workflow {repository}/{item}\n')
 
 
-def delete_old_workflow_runs(owner: str, github_token: str, number_of_workflow_runs_to_keep: int = 50) -> None:
+def delete_old_workflow_runs(owner: str, github_token: GitHubTokens, number_of_workflow_runs_to_keep: int = 50) -> None:
     """
     :param owner:
     :param github_token:
@@ -72,20 +156,67 @@ def delete_old_workflow_runs(owner: str, github_token: str, number_of_workflow_r
     print(f'Removing outdated workflow executions for owner {owner}, while retaining a maximum of '
           f'{number_of_workflow_runs_to_keep} workflow runs per repository:')
     l_repositories = get_repositories(owner=owner, github_token=github_token)
-    for repository in l_repositories:
-        workflow_run_ids = get_workflow_runs(owner=owner, repository=repository, github_token=github_token)
-        workflow_run_ids_sorted = sorted(workflow_run_ids, reverse=True)
-        workflow_run_ids_to_delete = workflow_run_ids_sorted[number_of_workflow_runs_to_keep:]
-        lib_log_utils.log_info(f'repository: {repository}, {len(workflow_run_ids)} workflow runs found, {len(workflow_run_ids_to_delete)} to delete.')
-        for run_id_to_delete in workflow_run_ids_to_delete:
-            print(f'remove workflow run {repository}/{run_id_to_delete}')
-            delete_workflow_run(owner=owner, repository=repository, github_token=github_token, run_id_to_delete=run_id_to_delete)
+
+    def get_run_ids_to_delete(repository: str) -> List[int]:
+        return _get_workflow_runs_to_delete(owner=owner, repository=repository, github_token=github_token,
+                                            number_of_workflow_runs_to_keep=number_of_workflow_runs_to_keep)
+
+    # first read the workflow runs to delete of all repositories, then delete all of them - both concurrently
+    repositories_run_ids_to_delete = _map_concurrently(get_run_ids_to_delete, l_repositories)
+    # format the url prefix once per repository, only the run id differs
+    runs_urls = {repository: f"https://api.github.com/repos/{owner}/{repository}/actions/runs/" for repository in l_repositories}
+    _process_by_repository(lambda repository, run_id_to_delete: _delete_workflow_run(url=runs_urls[repository] + str(run_id_to_delete), owner=owner,
+                                                                                     repository=repository, github_token=github_token,
+                                                                                     run_id_to_delete=run_id_to_delete),
+                           dict(zip(l_repositories, repositories_run_ids_to_delete)), 'remove workflow run {repository}/{item}\n')
+
+
+def _process_by_repository(function: Callable[[str, _T], Any], items_by_repository: Dict[str, List[_T]], line_format: str) -> None:
+    """
+    Calls function(repository, item) for the items of all repositories concurrently.
+    As soon as all items of a repository are done, a status line for each of them is written, with one write per repository.
+    So only work which was really done is reported - also if the first error stops the processing, see _map_concurrently().
+
+    >>> _process_by_repository(lambda repository, item: None, {'lib_a': [1, 2], 'lib_b': []}, 'processed {repository}/{item}\\n')
+    processed lib_a/1
+    processed lib_a/2
+
+    >>> _process_by_repository(lambda repository, item: int(item), {'lib_a': ['1', 'x']}, 'processed {repository}/{item}\\n')
+    Traceback (most recent call last):
+        ...
+    ValueError: invalid literal for int() with base 10: 'x'
+
+    """
+    lock = threading.Lock()
+    pending_items = {repository: len(items) for repository, items in items_by_repository.items()}
+
+    def process(repository_item: Tuple[str, _T]) -> None:
+        repository, item = repository_item
+        function(repository, item)
+        with lock:
+            pending_items[repository] -= 1
+            repository_done = pending_items[repository] == 0
+        if repository_done:
+            sys.stdout.write(''.join(line_format.format(repository=repository, item=item) for item in items_by_repository[repository]))
+
+    _map_concurrently(process, [(repository, item) for repository, items in items_by_repository.items() for item in items])
+
+
+def _get_workflow_runs_to_delete(owner: str, repository: str, github_token: GitHubTokens, number_of_workflow_runs_to_keep: int) -> List[int]:
+    """
+    returns the workflow runs of one repository, except the newest number_of_workflow_runs_to_keep
+    """
+    # the newest runs are not even fetched, all other runs are to be deleted
+    workflow_run_ids_to_delete = get_workflow_runs(owner=owner, repository=repository, github_token=github_token,
+                                                   number_of_newest_runs_to_skip=number_of_workflow_runs_to_keep)
+    lib_log_utils.log_info(f'repository: {repository}, {len(workflow_run_ids_to_delete)} workflow runs to delete.')
+    return workflow_run_ids_to_delete
 
 
 def get_owner() -> str:
     if lib_detect_testenv.is_testenv_active():
-        if os.getenv('GITHUB_ACTION'):
-            owner = os.environ.get('SECRET_GITHUB_OWNER')
+        if _env_get('GITHUB_ACTION'):
+            owner = _env_get('SECRET_GITHUB_OWNER')
         else:
             owner, github_token = read_github_credentials(config_directory=rotek_config_directory)
     else:
@@ -93,10 +224,12 @@ def get_owner() -> str:
     return owner
 
 
-def get_github_token() -> str:
+def get_github_token() -> GitHubTokens:
+    # one token from the environment, or one or several tokens from the credentials file
+    github_token: GitHubTokens
     if lib_detect_testenv.is_testenv_active():
-        if os.getenv('GITHUB_ACTION'):
-            github_token = os.environ.get('SECRET_GITHUB_TOKEN')
+        if _env_get('GITHUB_ACTION'):
+            github_token = _env_get('SECRET_GITHUB_TOKEN')
         else:
             owner, github_token = read_github_credentials(config_directory=rotek_config_directory)
     else:
@@ -104,25 +237,53 @@ def get_github_token() -> str:
     return github_token
 
 
-def read_github_credentials(config_directory: str) -> tuple[str, str]:
+def read_github_credentials(config_directory: str) -> Tuple[str, GitHubTokens]:
     """
-    Reads GitHub credentials from a Python file and returns them.
+    Reads GitHub credentials from 'github_credentials.toml' and returns them.
+    If there is no such file, the credentials are read from the legacy Python file 'github_credentials.py'.
+    The parsed file is cached by its modification time, so it is only read again after it was changed.
+
+    github_credentials.toml:
+        owner = "bitranox"
+        github_token = "..."
+        # or several tokens, which are used round-robin:
+        # github_token = ["...", "..."]
+
+    :param config_directory: The path to the directory containing the 'github_credentials.toml' or 'github_credentials.py' file.
+    :return: A tuple containing (owner, github_token), several tokens are returned as a tuple of tokens.
+
+    >>> import tempfile
+    >>> my_config_directory = tempfile.mkdtemp()
+    >>> my_credentials_file = pathlib.Path(my_config_directory) / 'github_credentials.toml'
+    >>> _ = my_credentials_file.write_text('owner = "bitranox"\\ngithub_token = "secret"\\n')
+    >>> read_github_credentials(my_config_directory)
+    ('bitranox', 'secret')
+
+    >>> # changed file - set the modification time explicitly, independent of the timestamp resolution of the filesystem
+    >>> _ = my_credentials_file.write_text('owner = "bitranox"\\ngithub_token = "new_secret"\\n')
+    >>> os.utime(my_credentials_file, ns=(0, 0))
+    >>> read_github_credentials(my_config_directory)
+    ('bitranox', 'new_secret')
+
+    >>> # an empty list of tokens
+    >>> _ = my_credentials_file.write_text('owner = "bitranox"\\ngithub_token = []\\n')
+    >>> os.utime(my_credentials_file, ns=(1, 1))
+    >>> read_github_credentials(my_config_directory)
+    An error occurred: Required variables 'github_token' or 'owner' were not found.
+    ('', '')
 
-    :param config_directory: The path to the directory containing the 'github_credentials.py' file.
-    :return: A tuple containing (owner, github_token).
     """
-    credentials_path = pathlib.Path(config_directory) / "github_credentials.py"
-    namespace: Dict[str, Any] = {}
+    credentials_path = pathlib.Path(config_directory) / "github_credentials.toml"
     owner = ""
-    github_token = ""
+    github_token: GitHubTokens = ""
     try:
-        with open(credentials_path, 'r') as file:
-            exec(file.read(), {}, namespace)
-        # Access the variables 'github_token' and 'owner' in the namespace dictionary
-        github_token = namespace.get('github_token')
-        owner = namespace.get('owner')
-        if github_token is None or owner is None:
-            raise ValueError("Required variables 'github_token' or 'owner' were not found.")
+        # a single stat() per file finds the file and gives the modification time for the cache
+        try:
+            credentials_stat = credentials_path.stat()
+        except FileNotFoundError:
+            credentials_path = credentials_path.with_suffix('.py')
+            credentials_stat = credentials_path.stat()
+        owner, github_token = _load_github_credentials(str(credentials_path), credentials_stat.st_mtime_ns)
 
     except FileNotFoundError:
         print(f"File could not be found. Check the path: {credentials_path}")
@@ -131,9 +292,552 @@ def read_github_credentials(config_directory: str) -> tuple[str, str]:
     return owner, github_token
 
 
-def get_repositories(owner: str, github_token: str) -> List[str]:
+@functools.lru_cache(maxsize=8)
+def _load_github_credentials(credentials_path: str, mtime_ns: int) -> Tuple[str, GitHubTokens]:
+    """
+    Parses the credentials file. mtime_ns is not used, it is only part of the cache key.
+    """
+    namespace: Dict[str, Any] = {}
+    if credentials_path.endswith('.toml'):
+        # parse, instead of compiling and executing Python code
+        namespace = tomllib.loads(pathlib.Path(credentials_path).read_text(encoding='utf-8'))
+    else:
+        exec(pathlib.Path(credentials_path).read_text(), {}, namespace)
+    # Access the variables 'github_token' and 'owner' in the namespace dictionary
+    github_token = namespace.get('github_token')
+    owner = namespace.get('owner')
+    # an empty list of tokens counts as missing - the round-robin over no tokens would fail in every request
+    if not github_token or owner is None:
+        raise ValueError("Required variables 'github_token' or 'owner' were not found.")
+    if isinstance(github_token, list):
+        github_token = tuple(github_token)
+    return owner, github_token
+
+
+def _cache_per_token(create: Callable[[_K], _R]) -> Callable[[_K], _R]:
+    """
+    Caches the object created for a token, like functools.lru_cache - but a cache miss is created under a lock.
+    lru_cache would let concurrent threads each create an object for the same token, for instance sessions with their own
+    connection pools, and keep only one of them.
+
+    >>> my_numbers = itertools.count()
+    >>> get_number = _cache_per_token(lambda token: next(my_numbers))
+    >>> _map_concurrently(get_number, ['token_a'] * 20) == [0] * 20
+    True
+    >>> get_number('token_b')
+    1
+
+    """
+    created: Dict[_K, _R] = {}
+    lock = threading.Lock()
+
+    @functools.wraps(create)
+    def get(token: _K) -> _R:
+        if token in created:
+            return created[token]
+        with lock:
+            if token not in created:
+                created[token] = create(token)
+            return created[token]
+
+    return get
+
+
+@_cache_per_token
+def _get_session(github_token: str) -> requests.Session:
+    """
+    Returns the requests.Session for the given token, created once and reused for all GitHub API calls.
+
+    The session carries the Authorization and Accept headers, keeps the HTTPS connection to api.github.com alive
+    (connection pooling), and retries transient server errors.
+    One session per token, because the token is passed to every API function and might differ between calls.
+
+    :param github_token: A personal access token for GitHub API authentication.
+    :return: the shared session for that token
+
+    >>> _get_session('some_token') is _get_session('some_token')
+    True
+    >>> _get_session('some_token').headers['Authorization']
+    'Bearer some_token'
+
+    """
+    session = requests.Session()
+    session.headers.update(GITHUB_API_HEADERS)
+    session.headers["Authorization"] = f"Bearer {github_token}"
+    # on exhausted retries return the last response, so raise_for_status() reports the original HTTPError.
+    # POST is only used for GraphQL queries (no mutations), so it is safe to repeat
+    # the server errors are repeated with exponential backoff, or after the time of a 'Retry-After' header (503).
+    # rate limit errors (403, 429) are repeated by _request() only - it sleeps without holding a request slot
+    retries = Retry(total=5, backoff_factor=2, status_forcelist=(502, 503, 504), respect_retry_after_header=True,
+                    allowed_methods=frozenset({"GET", "PUT", "DELETE", "POST"}), raise_on_status=False)
+    # all requests go to api.github.com, so one connection pool, with a keep-alive connection for every request in flight.
+    # pool_block: wait for a free connection rather than opening one more, which would be discarded afterwards
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=MAX_CONCURRENT_REQUESTS, pool_block=True, max_retries=retries))
+    # record the rate limit headers of every response
+    session.hooks['response'].append(_get_throttle(github_token).update)
+    return session
+
+
+class _GitHubThrottle:
+    """
+    Spreads the requests of one token over the rest of the rate limit window.
+
+    The rate limit headers 'X-RateLimit-Remaining' and 'X-RateLimit-Reset' are recorded after every response,
+    per 'X-RateLimit-Resource' - REST ('core') and GraphQL ('graphql') have separate budgets.
+    As soon as less than `threshold` requests are remaining, the requests of all threads are spaced (reset - now) / remaining seconds apart,
+    so the budget lasts until the window resets, instead of running into '403 rate limit exceeded'.
+    If nothing is remaining, every request waits for the reset.
+
+    >>> my_throttle = _GitHubThrottle(threshold=100)
+    >>> my_throttle.get_delay('core', now=1000.0)
+    0.0
+    >>> my_response = requests.Response()
+    >>> my_response.headers.update({'X-RateLimit-Resource': 'core', 'X-RateLimit-Remaining': '50', 'X-RateLimit-Reset': '1100'})
+    >>> my_throttle.update(my_response)
+    >>> [my_throttle.get_delay('core', now=1000.0) for _ in range(3)]
+    [0.0, 2.0, 4.0]
+    >>> my_throttle.get_delay('graphql', now=1000.0)
+    0.0
+    >>> my_response.headers['X-RateLimit-Remaining'] = '0'
+    >>> my_throttle.update(my_response)
+    >>> my_throttle.get_delay('core', now=1000.0)
+    100.0
+
+    """
+    def __init__(self, threshold: int = RATE_LIMIT_THRESHOLD) -> None:
+        self.threshold = threshold
+        # (remaining, reset) by rate limit resource
+        self.limits: Dict[str, Tuple[int, float]] = {}
+        # the earliest time for the next request by rate limit resource, shared by all threads
+        self._next_request_time: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def update(self, response: requests.Response, *args: Any, **kwargs: Any) -> None:
+        """ response hook of the session """
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        reset = response.headers.get('X-RateLimit-Reset')
+        if remaining is None or reset is None:
+            return
+        resource = response.headers.get('X-RateLimit-Resource', 'core')
+        with self._lock:
+            if resource in self.limits and self.limits[resource][1] != float(reset):
+                # a new rate limit window, the spacing of the old window does not apply anymore
+                self._next_request_time.pop(resource, None)
+            self.limits[resource] = (int(remaining), float(reset))
+
+    def get_delay(self, resource: str, now: float) -> float:
+        """ returns the seconds to wait before the next request, and reserves the time slot of that request """
+        with self._lock:
+            if resource not in self.limits:
+                return 0.0
+            remaining, reset = self.limits[resource]
+            if remaining >= self.threshold:
+                return 0.0
+            if remaining <= 0:
+                return max(0.0, reset - now)
+            request_time = max(now, self._next_request_time.get(resource, now))
+            self._next_request_time[resource] = request_time + max(0.0, reset - now) / remaining
+            return request_time - now
+
+    def wait(self, resource: str) -> None:
+        delay = self.get_delay(resource, now=time.time())
+        if delay:
+            time.sleep(delay)
+
+
+@_cache_per_token
+def _get_throttle(github_token: str) -> _GitHubThrottle:
+    """
+    Returns the throttle for the given token - the rate limit is accounted per token.
+
+    >>> _get_throttle('some_token') is _get_throttle('some_token')
+    True
+
+    """
+    return _GitHubThrottle()
+
+
+def _request(github_token: GitHubTokens, method: str, url: str, headers: Optional[Dict[str, str]] = None, stream: bool = False,
+             json_body: Optional[Dict[str, Any]] = None) -> requests.Response:
+    """
+    Sends a request with the session of the token (the next one of several tokens), while
+        - limiting the number of requests in flight to MAX_CONCURRENT_REQUESTS
+        - spreading the requests over the rate limit window, see _GitHubThrottle
+        - repeating the request after the indicated time, if GitHub answered with a rate limit error
+    with stream=True the body is not read - the caller needs to close the response.
+    """
+    for retry in range(MAX_RATE_LIMIT_RETRIES + 1):
+        token = _next_token(github_token)
+        session = _get_session(token)
+        # GraphQL has its own rate limit budget, all other requests use the REST ('core') budget
+        _get_throttle(token).wait('graphql' if url == GITHUB_GRAPHQL_URL else 'core')
+        with _request_slots:
+            response = session.request(method, url, headers=headers, stream=stream, json=json_body, timeout=REQUEST_TIMEOUT_SECONDS)
+        rate_limit_wait = _get_rate_limit_wait(response, now=time.time())
+        if rate_limit_wait is None or retry == MAX_RATE_LIMIT_RETRIES:
+            break
+        response.close()
+        lib_log_utils.log_warning(f'GitHub rate limit hit, retrying {method} {url} in {rate_limit_wait:.0f} seconds')
+        time.sleep(rate_limit_wait)
+    return response
+
+
+def _next_token(github_token: GitHubTokens) -> str:
+    """
+    Returns the token for the next request - several tokens are used round-robin, each with its own session and throttle.
+
+    >>> _next_token('token_a')
+    'token_a'
+    >>> [_next_token(('token_a', 'token_b')) for _ in range(3)]
+    ['token_a', 'token_b', 'token_a']
+
+    """
+    if isinstance(github_token, str):
+        return github_token
+    return next(_get_token_cycle(github_token))
+
+
+@_cache_per_token
+def _get_token_cycle(github_tokens: Tuple[str, ...]) -> Iterator[str]:
+    return itertools.cycle(github_tokens)
+
+
+def _get_rate_limit_wait(response: requests.Response, now: float) -> Optional[float]:
+    """
+    Returns the seconds to wait before repeating a request, which failed because of a rate limit, otherwise None.
+    Secondary rate limits send a 'Retry-After' header, an exhausted primary rate limit has 'X-RateLimit-Remaining: 0'.
+
+    >>> my_response = requests.Response()
+    >>> my_response.status_code = 403
+    >>> _get_rate_limit_wait(my_response, now=1000.0) is None
+    True
+    >>> my_response.headers['Retry-After'] = '60'
+    >>> _get_rate_limit_wait(my_response, now=1000.0)
+    60.0
+    >>> del my_response.headers['Retry-After']
+    >>> my_response.headers.update({'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '1030'})
+    >>> _get_rate_limit_wait(my_response, now=1000.0)
+    31.0
+
+    """
+    if response.status_code not in (403, 429):
+        return None
+    retry_after = response.headers.get('Retry-After')
+    if retry_after is not None:
+        return float(retry_after)
+    if response.headers.get('X-RateLimit-Remaining') == '0':
+        # one second more, to be safely after the reset
+        return max(0.0, float(response.headers.get('X-RateLimit-Reset', now)) - now) + 1
+    return None
+
+
+class _ETagCache:
+    """
+    On-disk cache of the listing pages, keyed by url.
+
+    For every page we store the ETag, the Last-Modified date, the extracted items and the pagination links.
+    On the next run they are sent as 'If-None-Match' and 'If-Modified-Since' - if nothing changed, GitHub answers '304 Not Modified'
+    without a body, and that response does not count against the rate limit.
+    The cache file is loaded on first use and written once at exit - then the entries of urls which were not requested
+    in this run are dropped, so pages which do not exist anymore (like the pages of deleted workflow runs) do not pile up.
+
+    >>> import tempfile
+    >>> my_cache = _ETagCache(pathlib.Path(tempfile.mkdtemp()) / 'etags.json')
+    >>> my_cache.get('https://api.github.com/users/bitranox/repos?per_page=100') is None
+    True
+    >>> my_cache.put('https://api.github.com/users/bitranox/repos?per_page=100', {'etag': 'W/"1"', 'items': ['lib_path'], 'links': {}})
+    >>> my_cache.save()
+    >>> my_next_run_cache = _ETagCache(my_cache.cache_file)
+    >>> my_next_run_cache.get('https://api.github.com/users/bitranox/repos?per_page=100')
+    {'etag': 'W/"1"', 'items': ['lib_path'], 'links': {}}
+
+    >>> # entries which were not used in a run are dropped
+    >>> my_next_run_cache.put('https://api.github.com/users/bitranox/repos?per_page=100&page=2', {'etag': 'W/"2"', 'items': [], 'links': {}})
+    >>> my_next_run_cache.save()
+    >>> my_third_run_cache = _ETagCache(my_cache.cache_file)
+    >>> my_third_run_cache.get('https://api.github.com/users/bitranox/repos?per_page=100&page=2')
+    {'etag': 'W/"2"', 'items': [], 'links': {}}
+    >>> my_third_run_cache.save()
+    >>> _ETagCache(my_cache.cache_file).get('https://api.github.com/users/bitranox/repos?per_page=100') is None
+    True
+
+    """
+    def __init__(self, cache_file: Optional[pathlib.Path] = None) -> None:
+        # None: resolved on first use, from the setting etag_cache_file or the default location
+        self.cache_file = cache_file
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        # the urls which were requested in this run, all other entries are dropped when saving
+        self._used_urls: Set[str] = set()
+        self._modified = False
+        self._lock = threading.Lock()
+
+    def _get_cache_file(self) -> pathlib.Path:
+        # needs to be called with self._lock held
+        if self.cache_file is None:
+            self.cache_file = etag_cache_file or _get_default_etag_cache_file()
+        return self.cache_file
+
+    def _get_entries(self) -> Dict[str, Dict[str, Any]]:
+        # needs to be called with self._lock held
+        if self._entries is None:
+            try:
+                self._entries = json.loads(self._get_cache_file().read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                # no cache yet, or unreadable - start with an empty one
+                self._entries = {}
+            # only a cache which is actually used is written at exit
+            atexit.register(self.save)
+        return self._entries
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            self._used_urls.add(url)
+            return self._get_entries().get(url)
+
+    def put(self, url: str, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self._used_urls.add(url)
+            self._get_entries()[url] = entry
+            self._modified = True
+
+    def save(self) -> None:
+        with self._lock:
+            if self._entries is None:
+                return
+            used_entries = {url: entry for url, entry in self._entries.items() if url in self._used_urls}
+            if not self._modified and len(used_entries) == len(self._entries):
+                return
+            self._entries = used_entries
+            cache_file = self._get_cache_file()
+            temp_file_name = None
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                # a temp file of its own for every process, in the same directory - so os.replace() can not cross filesystems
+                temp_file_descriptor, temp_file_name = tempfile.mkstemp(dir=cache_file.parent, prefix=cache_file.name, suffix='.tmp')
+                with os.fdopen(temp_file_descriptor, 'w', encoding='utf-8') as temp_file:
+                    temp_file.write(json.dumps(self._entries))
+                # atomic replace, so a concurrent run never reads a half written file
+                os.replace(temp_file_name, cache_file)
+                self._modified = False
+            except OSError as exc:
+                lib_log_utils.log_warning(f'can not write the ETag cache {cache_file}: {exc}')
+                if temp_file_name is not None:
+                    # the replace failed - do not leave the temp file behind
+                    try:
+                        os.unlink(temp_file_name)
+                    except OSError:
+                        pass
+
+
+def _get_default_etag_cache_file() -> pathlib.Path:
+    """
+    Returns the default location of the ETag cache: in $XDG_CACHE_HOME or ~/.cache,
+    or in the temp directory, if there is no writable home directory (like for some service accounts running scheduled jobs)
+
+    >>> _get_default_etag_cache_file().name
+    'etags.json'
+
+    """
+    cache_home = _env_get('XDG_CACHE_HOME')
+    if cache_home:
+        return pathlib.Path(cache_home) / "keep_github_workflows_active" / "etags.json"
+    try:
+        home = pathlib.Path.home()
+    except RuntimeError:
+        # the home directory can not be determined
+        home = None
+    if home is not None and os.access(home, os.W_OK):
+        return home / ".cache" / "keep_github_workflows_active" / "etags.json"
+    return pathlib.Path(tempfile.gettempdir()) / "keep_github_workflows_active" / "etags.json"
+
+
+# the location is resolved on first use, so etag_cache_file can still be set after the import
+_etag_cache = _ETagCache()
+
+
+def _fetch_all_pages(url: str, github_token: GitHubTokens, extract: Callable[[Any], List[_T]], first_page: int = 1) -> List[_T]:
+    """
+    GET all pages of a paginated GitHub API listing, starting at first_page.
+
+    The first response tells us the number of the last page (the 'last' link of the response headers),
+    so all remaining pages are fetched concurrently. If there is no 'last' link, we follow the 'next' links.
+
+    :param url: the url of the first page, must already contain a query string like '?per_page=100'
+    :param github_token: A personal access token for GitHub API authentication.
+    :param extract: function which returns the wanted items from the decoded json of one page.
+                    the items are stored in the ETag cache, so they must be json serializable.
+    :param first_page: the number of the first page to fetch, the pages before are skipped
+    :return: the extracted items of all pages, in page order
+    :raises requests.exceptions.HTTPError: on bad responses
+    """
+    def get_page(page_url: str) -> Tuple[List[_T], Dict[str, str]]:
+        # returns the extracted items and the pagination links {'next': url, 'last': url} of one page
+        cached = _etag_cache.get(page_url)
+        response = _request(github_token, 'GET', page_url, headers=_get_conditional_headers(cached))
+        if cached and response.status_code == 304:
+            return cached['items'], cached['links']
+        response.raise_for_status()  # Raises HTTPError for bad responses
+        page_items = extract(_decode_json(response))
+        links = _parse_link_header(response.headers.get('Link', ''))
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            _etag_cache.put(page_url, {'etag': etag, 'last_modified': last_modified, 'items': page_items, 'links': links})
+        return page_items, links
+
+    first_page_items, links = get_page(url if first_page == 1 else f'{url}&page={first_page}')
+    # copy, because the items might be the list stored in the ETag cache
+    items = list(first_page_items)
+
+    last_page = _get_page_number(links.get('last', ''))
+    if last_page:
+        page_urls = [f'{url}&page={page}' for page in range(first_page + 1, last_page + 1)]
+        for page_items, _ in _map_concurrently(get_page, page_urls):
+            items.extend(page_items)
+    else:
+        # Get the URL for the next page from the response headers, if present
+        next_url = links.get('next')
+        while next_url:
+            page_items, links = get_page(next_url)
+            items.extend(page_items)
+            next_url = links.get('next')
+    return items
+
+
+def _get_conditional_headers(cached: Optional[Dict[str, Any]]) -> Optional[Dict[str, str]]:
+    """
+    Returns the headers for a conditional GET of a page from its ETag cache entry, or None if the page is not cached.
+    (the entries of older cache files have no 'last_modified')
+
+    >>> _get_conditional_headers(None)
+    >>> _get_conditional_headers({'etag': 'W/"1"', 'last_modified': 'Wed, 14 Oct 2026 08:00:00 GMT', 'items': [], 'links': {}})
+    {'If-None-Match': 'W/"1"', 'If-Modified-Since': 'Wed, 14 Oct 2026 08:00:00 GMT'}
+    >>> _get_conditional_headers({'etag': 'W/"1"', 'items': [], 'links': {}})
+    {'If-None-Match': 'W/"1"'}
+
+    """
+    if not cached:
+        return None
+    headers: Dict[str, str] = {}
+    if cached.get('etag'):
+        headers['If-None-Match'] = cached['etag']
+    if cached.get('last_modified'):
+        headers['If-Modified-Since'] = cached['last_modified']
+    return headers
+
+
+class _GraphQLError(Exception):
+    """ GitHub answered a GraphQL query with errors """
+
+    def __init__(self, message: str, error_type: Optional[str] = None) -> None:
+        super().__init__(message)
+        # the 'type' of the first error, like 'NOT_FOUND' or 'INSUFFICIENT_SCOPES'
+        self.error_type = error_type
+
+
+def _graphql_query(github_token: GitHubTokens, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    POST a GraphQL query to GitHub, and return the 'data' of the response.
+
+    :raises requests.exceptions.HTTPError: on bad responses, for instance 'Bad credentials'
+    :raises _GraphQLError: if the query failed, with the message of the first error - 'Not Found' for unknown objects
+    """
+    response = _request(github_token, 'POST', GITHUB_GRAPHQL_URL, json_body={'query': query, 'variables': variables})
+    response.raise_for_status()  # Raises HTTPError for bad responses
+    result = _decode_json(response)
+    errors = result.get('errors')
+    if errors:
+        error_type = errors[0].get('type')
+        # use the same message as the REST API for unknown owners or repositories
+        raise _GraphQLError('Not Found' if error_type == 'NOT_FOUND' else errors[0].get('message', 'Error'), error_type)
+    data: Dict[str, Any] = result['data']
+    return data
+
+
+def _query_owner_repositories(github_token: GitHubTokens, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Runs a 'repositoryOwner(login: $owner) { repositories ... }' query, and returns one page of the 'repositories' connection.
+    GitHub answers an unknown login with 'repositoryOwner': null and without errors - that is reported as 'Not Found', like the REST API does.
+
+    :raises requests.exceptions.HTTPError: on bad responses, for instance 'Bad credentials'
+    :raises _GraphQLError: if the query failed, or the owner does not exist
+    """
+    repository_owner = _graphql_query(github_token, query, variables)['repositoryOwner']
+    if repository_owner is None:
+        raise _GraphQLError('Not Found', 'NOT_FOUND')
+    owner_repositories: Dict[str, Any] = repository_owner['repositories']
+    return owner_repositories
+
+
+def _decode_json(response: requests.Response) -> Any:
+    """
+    Decodes the json body of a response - with orjson, if installed.
+    """
+    if orjson is None:
+        return response.json()
+    return orjson.loads(response.content)
+
+
+def _parse_link_header(link_header: str) -> Dict[str, str]:
+    """
+    Returns the urls of the 'Link' response header by their relation, with a single regex scan.
+    (response.links would build a list of dicts via requests.utils.parse_header_links on every page)
+
+    >>> _parse_link_header('<https://api.github.com/user/1/repos?page=2>; rel="next", <https://api.github.com/user/1/repos?page=5>; rel="last"')
+    {'next': 'https://api.github.com/user/1/repos?page=2', 'last': 'https://api.github.com/user/1/repos?page=5'}
+    >>> _parse_link_header('')
+    {}
+
+    """
+    return {rel: url for url, rel in _LINK_HEADER_ENTRY.findall(link_header)}
+
+
+def _get_page_number(url: str) -> int:
+    """
+    Returns the value of the 'page' query parameter of an url, or 0 if there is none.
+
+    >>> _get_page_number('https://api.github.com/users/bitranox/repos?per_page=100&page=7')
+    7
+    >>> _get_page_number('https://api.github.com/users/bitranox/repos?per_page=100')
+    0
+    >>> _get_page_number('')
+    0
+
+    """
+    page_values = urllib.parse.parse_qs(urllib.parse.urlparse(url).query).get('page', ['0'])
+    return int(page_values[0])
+
+
+def _map_concurrently(function: Callable[[_T], _R], items: Iterable[_T]) -> List[_R]:
+    """
+    Calls function for every item in a thread pool, to overlap the waiting time for the GitHub API responses.
+    The results are returned in the order of the items.
+    Like a serial loop, the first exception raised by function stops the processing: calls which did not start yet are cancelled,
+    and the exception is re-raised.
+
+    >>> _map_concurrently(str.upper, ['a', 'b', 'c'])
+    ['A', 'B', 'C']
+
+    >>> _map_concurrently(int, ['1', 'x', '3'])
+    Traceback (most recent call last):
+        ...
+    ValueError: invalid literal for int() with base 10: 'x'
+
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        futures = [executor.submit(function, item) for item in items]
+        try:
+            return [future.result() for future in futures]
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+
+def get_repositories(owner: str, github_token: GitHubTokens) -> List[str]:
     """
     Fetch all repositories for a given GitHub user, handling pagination and setting the page size to 100.
+    Uses GraphQL, to transfer only the names of the repositories.
 
     :param owner: The username of the repository owner.
     :param github_token: A personal access token for GitHub API authentication.
@@ -161,37 +865,100 @@ def get_repositories(owner: str, github_token: str) -> List[str]:
 
 
     """
-    repositories = []
-    url = f"https://api.github.com/users/{owner}/repos?per_page=100"
-    headers = {
-        "Authorization": f"Bearer {github_token}",
-        "Accept": "application/vnd.github.v3+json"
-    }
+    repositories: List[str] = []
+    variables = {'owner': owner, 'after': None}
 
-    while url:
-        try:
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()  # Raises HTTPError for bad responses
-            data = response.json()
-            repositories.extend([repo['name'] for repo in data])
+    try:
+        while True:
+            owner_repositories = _query_owner_repositories(github_token, _REPOSITORIES_QUERY, variables)
+            repositories.extend(repo['name'] for repo in owner_repositories['nodes'])
+            if not owner_repositories['pageInfo']['hasNextPage']:
+                break
+            variables['after'] = owner_repositories['pageInfo']['endCursor']
 
-            # Get the URL for the next page from the response headers, if present
-            url = response.links.get('next', {}).get('url', None)
+    except requests.exceptions.HTTPError as exc:
+        error_message = _decode_json(exc.response).get("message", "Error")
+        result = f'ERROR reading repositories for user {owner}: {error_message}'
+        lib_log_utils.log_error(result)
+        raise RuntimeError(result) from exc
 
-        except requests.exceptions.HTTPError as exc:
-            error_message = exc.response.json().get("message", "Error")
-            result = f'ERROR reading repositories for user {owner}: {error_message}'
-            lib_log_utils.log_error(result)
-            raise RuntimeError(result) from exc
+    except _GraphQLError as exc:
+        result = f'ERROR reading repositories for user {owner}: {exc}'
+        lib_log_utils.log_error(result)
+        raise RuntimeError(result) from exc
 
     result = f'Found {len(repositories)} repositories for user {owner}'
     lib_log_utils.log_info(result)
     return repositories
 
 
-def get_workflows(owner: str, repository: str, github_token: str) -> List[str]:
+def _list_repos_with_workflows_graphql(owner: str, github_token: GitHubTokens) -> Dict[str, List[str]]:
+    """
+    Fetch all repositories for a given GitHub user together with their workflow files, with one GraphQL query per 100 repositories -
+    instead of get_repositories() and one get_workflows() call per repository.
+    The workflow files are the '.yml' and '.yaml' files in the '.github/workflows' directory of the default branch.
+    If the token lacks the scopes to read the repository contents, get_repositories() and get_workflows() are used instead.
+
+    :param owner: The username of the repository owner.
+    :param github_token: A personal access token for GitHub API authentication.
+    :return: the workflow file names by repository name, the repositories sorted by name
+
+    >>> # Setup
+    >>> my_owner = get_owner()
+    >>> my_github_token = get_github_token()
+
+    >>> # Test Ok
+    >>> _list_repos_with_workflows_graphql(my_owner, my_github_token)
+    {'...': [...], ...}
+
+    >>> # Test user not existing
+    >>> _list_repos_with_workflows_graphql('user_does_not_exist', my_github_token)
+    Traceback (most recent call last):
+        ...
+    RuntimeError: ERROR reading repositories for user user_does_not_exist: Not Found
+
+    """
+    repositories_workflows: Dict[str, List[str]] = {}
+    variables = {'owner': owner, 'after': None}
+
+    try:
+        while True:
+            owner_repositories = _query_owner_repositories(github_token, _REPOSITORIES_WORKFLOWS_QUERY, variables)
+            for repo in owner_repositories['nodes']:
+                # 'object' is None if there is no '.github/workflows' directory
+                entries = (repo['object'] or {}).get('entries') or []
+                repositories_workflows[repo['name']] = [entry['name'] for entry in entries
+                                                        if entry['name'].endswith(('.yml', '.yaml'))
+                                                        and not entry['name'].startswith(_UNMANAGEABLE_WORKFLOW_PREFIXES)]
+            if not owner_repositories['pageInfo']['hasNextPage']:
+                break
+            variables['after'] = owner_repositories['pageInfo']['endCursor']
+
+    except requests.exceptions.HTTPError as exc:
+        error_message = _decode_json(exc.response).get("message", "Error")
+        result = f'ERROR reading repositories for user {owner}: {error_message}'
+        lib_log_utils.log_error(result)
+        raise RuntimeError(result) from exc
+
+    except _GraphQLError as exc:
+        if exc.error_type == 'INSUFFICIENT_SCOPES':
+            lib_log_utils.log_warning(f'can not read the workflow files of user {owner} via GraphQL: {exc}, using the REST API')
+            repositories = get_repositories(owner=owner, github_token=github_token)
+            workflows = _map_concurrently(lambda repository: get_workflows(owner=owner, repository=repository, github_token=github_token), repositories)
+            return dict(zip(repositories, workflows))
+        result = f'ERROR reading repositories for user {owner}: {exc}'
+        lib_log_utils.log_error(result)
+        raise RuntimeError(result) from exc
+
+    result = f'Found {len(repositories_workflows)} repositories for user {owner}'
+    lib_log_utils.log_info(result)
+    return repositories_workflows
+
+
+def get_workflows(owner: str, repository: str, github_token: GitHubTokens) -> List[str]:
     """
     Fetch all workflows for a given GitHub repository, handling pagination and setting the page size to 100.
+    The dynamic workflows of GitHub Pages and Dependabot can not be enabled via the API, so they are not returned.
 
     :param owner: The username of the repository owner.
     :param repository: The name of the repository.
@@ -230,42 +997,36 @@ def get_workflows(owner: str, repository: str, github_token: str) -> List[str]:
 
 
     """
-    workflows = []
     url = f"https://api.github.com/repos/{owner}/{repository}/actions/workflows?per_page=100"
-    headers = {
-        "Authorization": f"Bearer {github_token}",
-        "Accept": "application/vnd.github.v3+json"
-    }
-
-    while url:
-        try:
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()  # Raises HTTPError for bad responses
-            data = response.json()
-            workflows.extend([pathlib.Path(workflow['path']).name for workflow in data.get('workflows', [])])
 
-            # Get the URL for the next page from the response headers, if present
-            url = response.links.get('next', {}).get('url', None)
+    try:
+        workflow_paths = _fetch_all_pages(url, github_token, lambda data: [workflow['path'] for workflow in data.get('workflows', ())])
 
-        except requests.exceptions.HTTPError as exc:
-            error_message = exc.response.json().get("message", "Error")
-            result = f'ERROR reading workflows for user: {owner}, repository: {repository}, {error_message}'
-            lib_log_utils.log_error(result)
-            raise RuntimeError(result) from exc
+    except requests.exceptions.HTTPError as exc:
+        error_message = _decode_json(exc.response).get("message", "Error")
+        result = f'ERROR reading workflows for user: {owner}, repository: {repository}, {error_message}'
+        lib_log_utils.log_error(result)
+        raise RuntimeError(result) from exc
 
+    # GitHub workflow paths are always '/' separated, like '.github/workflows/python-package.yml' - no need for pathlib
+    workflows = [workflow_name for workflow_name in (workflow_path.rpartition('/')[2] for workflow_path in workflow_paths)
+                 if not workflow_name.startswith(_UNMANAGEABLE_WORKFLOW_PREFIXES)]
     result = f'Found {len(workflows)} workflows for user: {owner}, repository: {repository}'
     lib_log_utils.log_info(result)
     return workflows
 
 
-def get_workflow_runs(owner: str, repository: str, github_token: str) -> List[str]:
+def get_workflow_runs(owner: str, repository: str, github_token: GitHubTokens, number_of_newest_runs_to_skip: int = 0) -> List[int]:
     """
     Fetch all workflow runs for a GitHub repository using the GitHub API v3, handling pagination.
+    GitHub lists the runs newest first, so pages which only contain skipped runs are not fetched at all.
+    Uses REST, because the GraphQL API of GitHub has no listing of workflow runs per repository.
 
     :param owner: The username of the repository owner.
     :param repository: The name of the repository.
     :param github_token: A GitHub personal access token for authentication.
-    :return: A list of workflow run IDs.
+    :param number_of_newest_runs_to_skip: the number of newest runs which are not returned
+    :return: A list of workflow run IDs (integers), newest first.
 
     >>> # Setup
     >>> my_owner = get_owner()
@@ -281,37 +1042,27 @@ def get_workflow_runs(owner: str, repository: str, github_token: str) -> List[st
 
     """
     # set pagination to 100 (the maximum at GitHub), to have fewer requests
-    url = f"https://api.github.com/repos/{owner}/{repository}/actions/runs?per_page=100"
-    headers = {
-        "Authorization": f"Bearer {github_token}",
-        "Accept": "application/vnd.github.v3+json"
-    }
-
-    l_workflow_run_ids = []
-    while url:
-        try:
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()  # Raises an HTTPError if the response was an error
-
-            # Process response data
-            data = response.json()
-            l_workflow_run_ids.extend([run['id'] for run in data.get('workflow_runs', [])])
+    per_page = 100
+    # exclude_pull_requests : we only need the IDs, so leave out the pull request list of every run - smaller pages, faster json decoding
+    url = f"https://api.github.com/repos/{owner}/{repository}/actions/runs?per_page={per_page}&exclude_pull_requests=true"
+    pages_to_skip, runs_to_skip_on_first_page = divmod(number_of_newest_runs_to_skip, per_page)
 
-            # Check for the 'next' page link
-            url = response.links.get('next', {}).get('url', None)
+    try:
+        l_workflow_run_ids = _fetch_all_pages(url, github_token, lambda data: [run['id'] for run in data.get('workflow_runs', ())],
+                                              first_page=pages_to_skip + 1)[runs_to_skip_on_first_page:]
 
-        except requests.exceptions.HTTPError as exc:
-            result_error_message = exc.response.json().get("message", "Error")
-            result = f'ERROR reading workflow runs for user: {owner}, repository: {repository}, {result_error_message}'
-            lib_log_utils.log_error(result)
-            raise RuntimeError(result) from exc
+    except requests.exceptions.HTTPError as exc:
+        result_error_message = _decode_json(exc.response).get("message", "Error")
+        result = f'ERROR reading workflow runs for user: {owner}, repository: {repository}, {result_error_message}'
+        lib_log_utils.log_error(result)
+        raise RuntimeError(result) from exc
 
     result = f'Found {len(l_workflow_run_ids)} workflow runs for user: {owner}, repository: {repository}'
     lib_log_utils.log_info(result)
     return l_workflow_run_ids
 
 
-def delete_workflow_run(owner: str, repository: str, github_token: str, run_id_to_delete: str) -> None:
+def delete_workflow_run(owner: str, repository: str, github_token: GitHubTokens, run_id_to_delete: int) -> None:
     """
     Delete a specified workflow run for a GitHub repository.
 
@@ -322,13 +1073,19 @@ def delete_workflow_run(owner: str, repository: str, github_token: str, run_id_t
     :return: None
     """
     url = f"https://api.github.com/repos/{owner}/{repository}/actions/runs/{run_id_to_delete}"
-    headers = {
-        "Authorization": f"Bearer {github_token}",
-        "Accept": "application/vnd.github.v3+json"
-    }
+    _delete_workflow_run(url=url, owner=owner, repository=repository, github_token=github_token, run_id_to_delete=run_id_to_delete)
+
 
+def _delete_workflow_run(url: str, owner: str, repository: str, github_token: GitHubTokens, run_id_to_delete: int) -> None:
+    """
+    Delete the workflow run with the given url - owner, repository and run_id_to_delete are only used for the messages.
+    """
     try:
-        response = requests.delete(url, headers=headers)
+        # the body is never used, so do not read it into memory.
+        # drain_conn() gives the connection back to the pool - a plain close() would close the keep-alive connection
+        response = _request(github_token, 'DELETE', url, stream=True)
+        response.raw.drain_conn()
+        response.close()
 
         if response.status_code == 204:
             result = f'Deleted workflow run ID: {run_id_to_delete} for user: {owner}, repository: {repository}'
@@ -341,7 +1098,7 @@ def delete_workflow_run(owner: str, repository: str, github_token: str, run_id_t
         raise RuntimeError(result_error_message) from exc
 
 
-def enable_workflow(owner: str, repository: str, workflow_filename: str, github_token: str) -> str:
+def enable_workflow(owner: str, repository: str, workflow_filename: str, github_token: GitHubTokens) -> str:
     """
     Enable a workflow in a GitHub repository using the GitHub API.
 
@@ -349,7 +1106,7 @@ def enable_workflow(owner: str, repository: str, workflow_filename: str, github_
     :param repository: The name of the repository.
     :param workflow_filename: The name of the workflow file, for example, "python-package.yml".
     :param github_token: A GitHub access token with permissions to enable workflows.
-    :return: A success message if the workflow is enabled.
+    :return: A success message if the workflow is enabled, or a message that it was skipped, for the dynamic workflows of GitHub.
 
 
     >>> # Setup
@@ -379,24 +1136,26 @@ def enable_workflow(owner: str, repository: str, workflow_filename: str, github_
         ...
     RuntimeError: ERROR enabling repository lib_path, workflow python-package.yml: Bad credentials
 
+    >>> # dynamic workflow, no request at all
+    >>> enable_workflow(owner=my_owner, repository="lib_path", workflow_filename="pages-build-deployment", github_token="wrong_credentials")
+    'Repository lib_path, workflow pages-build-deployment skipped'
+
 
     """
-    url = f"https://api.github.com/repos/{owner}/{repository}/actions/workflows/{workflow_filename}/enable"
+    if workflow_filename.startswith(_UNMANAGEABLE_WORKFLOW_PREFIXES):
+        return f'Repository {repository}, workflow {workflow_filename} skipped'
 
-    headers = {
-        "Accept": "application/vnd.github.v3+json",
-        "Authorization": f"Bearer {github_token}"
-    }
+    url = f"https://api.github.com/repos/{owner}/{repository}/actions/workflows/{workflow_filename}/enable"
 
     try:
-        response = requests.put(url, headers=headers)
+        response = _request(github_token, 'PUT', url)
         response.raise_for_status()  # This will raise an exception for HTTP error codes
         result = f'Enabled repository {repository}, workflow {workflow_filename}'
         lib_log_utils.log_info(result)
         return result
 
     except requests.exceptions.HTTPError as exc:
-        error_message = response.json().get("message", "Error")     # noqa
+        error_message = _decode_json(response).get("message", "Error")     # noqa
         result = f'ERROR enabling repository {repository}, workflow {workflow_filename}: {error_message}'
         lib_log_utils.log_error(result)
         raise RuntimeError(result) from exc